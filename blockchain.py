@@ -5,9 +5,162 @@ Implementa las clases Block y Blockchain para encadenar registros con hash
 
 import hashlib
 import json
-from datetime import datetime
+import operator
+import sys
+import time
+from itertools import compress
 from typing import List, Optional, Dict, Any
 
+try:
+    # orjson es opcional: si está instalado, serializa y parsea el JSON en C
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Constructor SHA-256 de hashlib (respaldado por OpenSSL, que ya usa las
+# extensiones SHA de la CPU cuando están disponibles). Se enlaza una sola vez
+# para evitar la búsqueda del atributo en cada cálculo de hash.
+_sha256 = hashlib.sha256
+
+# prev_hash del bloque génesis. Se serializa como "0" para mantener el
+# formato (y los hashes) de las cadenas guardadas anteriormente.
+GENESIS_PREV_HASH = bytes(32)
+
+# Formato de las marcas de tiempo de los bloques (hora local)
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Última marca de tiempo generada y el segundo al que corresponde
+_last_second: Optional[int] = None
+_last_timestamp = ""
+
+# Asignación de atributos sin pasar por Block.__setattr__
+_set_slot = object.__setattr__
+
+# Campos de Block que forman parte del hash
+_HASHED_FIELDS = frozenset(("block_id", "timestamp", "data", "prev_hash"))
+
+# Separadores usados al mostrar la cadena en consola
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
+_SEP_HASH = "#" * 60
+
+
+def _hash_to_hex(value: Any) -> Any:
+    """
+    Convierte un hash en bytes a su representación hexadecimal.
+    
+    Args:
+        value: Hash de 32 bytes, o el valor tal cual se leyó del archivo si
+            no era un hash hexadecimal canónico (ver _hash_from_hex)
+        
+    Returns:
+        String hexadecimal ("0" para el prev_hash del bloque génesis), o el
+        valor original sin modificar si no es un hash en bytes
+    """
+    if not isinstance(value, bytes):
+        return value
+    if value == GENESIS_PREV_HASH:
+        return "0"
+    return value.hex()
+
+
+def _hash_from_hex(text: Any) -> Any:
+    """
+    Convierte un hash hexadecimal (como se guarda en JSON) a bytes.
+    
+    Solo se convierten los valores canónicos: 64 dígitos hexadecimales en
+    minúscula, o "0" para el prev_hash del bloque génesis. Cualquier otro
+    valor (p. ej. un archivo editado a mano) se conserva tal cual, para que
+    no impida la carga y verify_chain lo detecte como alteración.
+    
+    Args:
+        text: Valor leído del archivo
+        
+    Returns:
+        Hash de 32 bytes, o el valor original si no es canónico
+    """
+    if text == "0":
+        return GENESIS_PREV_HASH
+    if isinstance(text, str) and len(text) == 64:
+        try:
+            raw = bytes.fromhex(text)
+        except ValueError:
+            return text
+        # fromhex acepta mayúsculas y espacios: exigir la forma exacta
+        if raw.hex() == text and raw != GENESIS_PREV_HASH:
+            return raw
+    return text
+
+
+def _current_timestamp() -> str:
+    """
+    Obtiene la marca de tiempo actual con el formato de los bloques.
+    
+    La resolución es de segundos, así que el texto formateado se reutiliza
+    mientras no cambie el segundo en curso.
+    
+    Returns:
+        Marca de tiempo como "AAAA-MM-DD HH:MM:SS"
+    """
+    global _last_second, _last_timestamp
+    second = int(time.time())
+    if second != _last_second:
+        _last_second = second
+        _last_timestamp = time.strftime(_TIMESTAMP_FORMAT, time.localtime(second))
+    return _last_timestamp
+
+
+def _dump_json(chain_data: List[Dict[str, Any]]) -> bytes:
+    """
+    Serializa la cadena a JSON (UTF-8, indentado con 2 espacios).
+    
+    Args:
+        chain_data: Lista de bloques como diccionarios
+        
+    Returns:
+        Documento JSON codificado en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(chain_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(chain_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """
+    Parsea un documento JSON codificado en UTF-8.
+    
+    Args:
+        raw: Contenido del archivo
+        
+    Returns:
+        El objeto decodificado
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _hash_blocks(blocks: List['Block']) -> List[bytes]:
+    """
+    Recalcula en un solo lote el hash de una secuencia de bloques.
+    
+    Los hashes de los bloques son independientes entre sí, por lo que se
+    calculan todos de una vez antes de comparar, en lugar de intercalar el
+    cálculo con las comprobaciones de la cadena.
+    
+    El cálculo es secuencial a propósito: hashlib solo libera el GIL con
+    entradas de más de ~2 KB y los bloques son mucho más pequeños, así que
+    repartirlos entre hilos no aporta paralelismo real.
+    
+    Args:
+        blocks: Bloques cuyo hash se desea recalcular
+        
+    Returns:
+        Lista con el hash calculado de cada bloque, en el mismo orden
+    """
+    return [block.calculate_hash() for block in blocks]
+
 
 class Block:
     """
@@ -15,7 +168,14 @@ class Block:
     Cada bloque contiene datos y un hash que depende del bloque anterior.
     """
     
-    def __init__(self, block_id: int, timestamp: str, data: str, prev_hash: str):
+    # Sin __dict__ por instancia: menos memoria por bloque en cadenas largas
+    __slots__ = (
+        "block_id", "timestamp", "data", "prev_hash", "hash",
+        "_recomputed_hash",
+    )
+    
+    def __init__(self, block_id: int, timestamp: str, data: str, prev_hash: bytes,
+                 stored_hash: Optional[bytes] = None):
         """
         Inicializa un nuevo bloque.
         
@@ -23,28 +183,62 @@ class Block:
             block_id: Identificador único del bloque
             timestamp: Marca de tiempo de creación
             data: Datos del bloque (transacción, mensaje, etc.)
-            prev_hash: Hash del bloque anterior
+            prev_hash: Hash del bloque anterior (32 bytes)
+            stored_hash: Hash ya conocido del bloque (p. ej. leído de un
+                archivo); si se omite, se calcula a partir de los campos
+        """
+        # Hash recalculado a partir de los campos actuales (caché de
+        # verificación). Es independiente de self.hash, que es el almacenado.
+        _set_slot(self, "_recomputed_hash", None)
+        # Asignación directa a los slots: en un bloque nuevo no hay cachés
+        # que invalidar, así que no hace falta pasar por __setattr__
+        _set_slot(self, "block_id", block_id)
+        _set_slot(self, "timestamp", timestamp)
+        _set_slot(self, "data", data)
+        _set_slot(self, "prev_hash", prev_hash)
+        _set_slot(self, "hash",
+                  self.calculate_hash() if stored_hash is None else stored_hash)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Asigna un atributo e invalida el hash recalculado si forma parte de él.
+        
+        La lectura de los campos es un acceso directo al slot; solo la
+        escritura (poco frecuente, p. ej. corrupt_block) pasa por aquí.
         """
-        self.block_id = block_id
-        self.timestamp = timestamp
-        self.data = data
-        self.prev_hash = prev_hash
-        self.hash = self.calculate_hash()
+        _set_slot(self, name, value)
+        if name in _HASHED_FIELDS:
+            _set_slot(self, "_recomputed_hash", None)
     
-    def calculate_hash(self) -> str:
+    def calculate_hash(self) -> bytes:
         """
         Calcula el hash SHA-256 del bloque basado en sus atributos.
         
         Fórmula: hash = SHA256(block_id || timestamp || data || prev_hash)
         
+        El resultado se guarda en caché hasta que cambie alguno de los campos,
+        de modo que verificar varias veces la cadena no repite el cálculo.
+        
         Returns:
-            String hexadecimal del hash calculado
+            Hash calculado (32 bytes)
         """
-        # Concatenar todos los campos del bloque
-        block_string = f"{self.block_id}{self.timestamp}{self.data}{self.prev_hash}"
+        if self._recomputed_hash is not None:
+            return self._recomputed_hash
+        
+        # Concatenar todos los campos del bloque; prev_hash entra en forma
+        # hexadecimal, como en el formato original
+        block_string = f"{self.block_id}{self.timestamp}{self.data}{_hash_to_hex(self.prev_hash)}"
         
         # Calcular hash SHA-256
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        digest = _sha256(block_string.encode()).digest()
+        
+        # Si coincide con el almacenado, compartir ese objeto en vez de
+        # guardar una segunda copia de los mismos 32 bytes
+        stored = getattr(self, "hash", None)
+        if digest == stored:
+            digest = stored
+        _set_slot(self, "_recomputed_hash", digest)
+        return digest
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -57,8 +251,8 @@ class Block:
             'block_id': self.block_id,
             'timestamp': self.timestamp,
             'data': self.data,
-            'prev_hash': self.prev_hash,
-            'hash': self.hash
+            'prev_hash': _hash_to_hex(self.prev_hash),
+            'hash': _hash_to_hex(self.hash)
         }
     
     @staticmethod
@@ -72,27 +266,32 @@ class Block:
         Returns:
             Instancia de Block
         """
+        # Preservar el hash original (puede estar corrupto para pruebas), sin
+        # calcular antes uno nuevo que se descartaría
+        stored_hash = _hash_from_hex(block_dict['hash'])
         block = Block(
             block_dict['block_id'],
             block_dict['timestamp'],
             block_dict['data'],
-            block_dict['prev_hash']
+            _hash_from_hex(block_dict['prev_hash']),
+            stored_hash=stored_hash
         )
-        # Preservar el hash original (puede estar corrupto para pruebas)
-        block.hash = block_dict['hash']
+        if stored_hash is None:
+            # Un hash nulo en el archivo también se conserva tal cual
+            _set_slot(block, "hash", None)
         return block
     
     def __str__(self) -> str:
         """Representación en string del bloque para mostrar en consola."""
         return (
-            f"\n{'='*60}\n"
+            f"\n{_SEP_EQ}\n"
             f"Bloque #{self.block_id}\n"
-            f"{'-'*60}\n"
+            f"{_SEP_DASH}\n"
             f"Timestamp:    {self.timestamp}\n"
             f"Datos:        {self.data}\n"
-            f"Hash Previo:  {self.prev_hash}\n"
-            f"Hash Actual:  {self.hash}\n"
-            f"{'='*60}"
+            f"Hash Previo:  {_hash_to_hex(self.prev_hash)}\n"
+            f"Hash Actual:  {_hash_to_hex(self.hash)}\n"
+            f"{_SEP_EQ}"
         )
 
 
@@ -102,21 +301,47 @@ class Blockchain:
     Gestiona la creación, validación y persistencia de la blockchain.
     """
     
-    def __init__(self):
-        """Inicializa la blockchain con el bloque génesis."""
+    def __init__(self, create_genesis: bool = True):
+        """
+        Inicializa la blockchain con el bloque génesis.
+        
+        Args:
+            create_genesis: Si es False, la cadena queda vacía (para llenarla
+                después desde un archivo con load_from_file)
+        """
         self.chain: List[Block] = []
-        self.create_genesis_block()
+        if create_genesis:
+            self.create_genesis_block()
+    
+    @classmethod
+    def load_or_new(cls, filename: str = "blockchain.json") -> 'Blockchain':
+        """
+        Carga la blockchain desde un archivo o crea una nueva si no es posible.
+        
+        El bloque génesis solo se crea cuando la carga falla.
+        
+        Args:
+            filename: Nombre del archivo a cargar
+            
+        Returns:
+            La blockchain cargada, o una nueva con solo el bloque génesis
+        """
+        blockchain = cls(create_genesis=False)
+        if not blockchain.load_from_file(filename):
+            blockchain.create_genesis_block()
+        return blockchain
     
     def create_genesis_block(self) -> None:
         """
         Crea el primer bloque de la cadena (bloque génesis).
-        Este bloque no tiene predecesor, por lo que su prev_hash es "0".
+        Este bloque no tiene predecesor, por lo que su prev_hash es
+        GENESIS_PREV_HASH (se guarda como "0").
         """
         genesis_block = Block(
             block_id=0,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=_current_timestamp(),
             data="Bloque Génesis - Inicio de la cadena",
-            prev_hash="0"
+            prev_hash=GENESIS_PREV_HASH
         )
         self.chain.append(genesis_block)
     
@@ -142,7 +367,7 @@ class Blockchain:
         latest_block = self.get_latest_block()
         new_block = Block(
             block_id=latest_block.block_id + 1,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=_current_timestamp(),
             data=data,
             prev_hash=latest_block.hash
         )
@@ -162,30 +387,54 @@ class Blockchain:
         """
         errors = []
         
+        # Una cadena sin bloques no tiene ni siquiera el bloque génesis
+        if not self.chain:
+            errors.append("❌ Cadena vacía: no contiene ningún bloque (falta el bloque génesis)")
+            return False, errors
+        
+        computed_hashes = _hash_blocks(self.chain)
+        
+        # Vista por columnas (hashes almacenados y prev_hash) de la cadena:
+        # si ambas columnas cuadran, la comparación se resuelve en C sobre
+        # listas completas, sin recorrer los bloques uno a uno en Python
+        stored_hashes = [block.hash for block in self.chain]
+        prev_hashes = [block.prev_hash for block in self.chain]
+        if stored_hashes == computed_hashes and prev_hashes[1:] == stored_hashes[:-1]:
+            return True, errors
+        
         # El bloque génesis (índice 0) se verifica solo recalculando su hash
         genesis = self.chain[0]
-        if genesis.hash != genesis.calculate_hash():
+        if genesis.hash != computed_hashes[0]:
             errors.append(f"❌ Bloque #{genesis.block_id}: Hash corrupto (no coincide con el calculado)")
         
+        # Máscaras de bloques con hash corrupto y con enlace roto, calculadas
+        # columna a columna en C; el bucle en Python solo visita los bloques
+        # marcados en alguna de las dos
+        bad_hashes = list(map(operator.ne, stored_hashes, computed_hashes))
+        bad_links = [False]
+        bad_links.extend(map(operator.ne, prev_hashes[1:], stored_hashes[:-1]))
+        flagged = compress(range(1, len(self.chain)),
+                           map(operator.or_, bad_hashes[1:], bad_links[1:]))
+        
         # Verificar el resto de bloques
-        for i in range(1, len(self.chain)):
+        for i in flagged:
             current_block = self.chain[i]
             previous_block = self.chain[i - 1]
             
             # Verificar que el hash del bloque actual sea correcto
-            if current_block.hash != current_block.calculate_hash():
+            if bad_hashes[i]:
                 errors.append(
                     f"❌ Bloque #{current_block.block_id}: Hash corrupto\n"
-                    f"   Hash almacenado: {current_block.hash}\n"
-                    f"   Hash calculado:  {current_block.calculate_hash()}"
+                    f"   Hash almacenado: {_hash_to_hex(current_block.hash)}\n"
+                    f"   Hash calculado:  {computed_hashes[i].hex()}"
                 )
             
             # Verificar que el prev_hash apunte al bloque anterior
-            if current_block.prev_hash != previous_block.hash:
+            if bad_links[i]:
                 errors.append(
                     f"❌ Bloque #{current_block.block_id}: Enlace roto con bloque anterior\n"
-                    f"   prev_hash esperado: {previous_block.hash}\n"
-                    f"   prev_hash actual:   {current_block.prev_hash}"
+                    f"   prev_hash esperado: {_hash_to_hex(previous_block.hash)}\n"
+                    f"   prev_hash actual:   {_hash_to_hex(current_block.prev_hash)}"
                 )
         
         is_valid = len(errors) == 0
@@ -193,12 +442,14 @@ class Blockchain:
     
     def display_chain(self) -> None:
         """Muestra todos los bloques de la cadena en consola."""
-        print(f"\n{'#'*60}")
-        print(f"  BLOCKCHAIN - Total de bloques: {len(self.chain)}")
-        print(f"{'#'*60}")
+        header = (
+            f"\n{_SEP_HASH}\n"
+            f"  BLOCKCHAIN - Total de bloques: {len(self.chain)}\n"
+            f"{_SEP_HASH}\n"
+        )
         
-        for block in self.chain:
-            print(block)
+        # Una sola escritura para toda la cadena en lugar de un print por bloque
+        sys.stdout.write(header + "".join(f"{block}\n" for block in self.chain))
     
     def save_to_file(self, filename: str = "blockchain.json") -> None:
         """
@@ -209,8 +460,10 @@ class Blockchain:
         """
         chain_data = [block.to_dict() for block in self.chain]
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(chain_data, f, indent=2, ensure_ascii=False)
+        # Serializar todo de una vez y escribirlo con una única llamada
+        payload = _dump_json(chain_data)
+        with open(filename, 'wb') as f:
+            f.write(payload)
         
         print(f"\n✅ Blockchain guardada en '{filename}'")
     
@@ -225,10 +478,14 @@ class Blockchain:
             True si se cargó exitosamente, False en caso contrario
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                chain_data = json.load(f)
+            with open(filename, 'rb') as f:
+                chain_data = _load_json(f.read())
             
-            self.chain = [Block.from_dict(block_dict) for block_dict in chain_data]
+            # Convertir en el sitio: cada diccionario se libera en cuanto se
+            # sustituye por su bloque, sin tener ambas listas completas a la vez
+            for i, block_dict in enumerate(chain_data):
+                chain_data[i] = Block.from_dict(block_dict)
+            self.chain = chain_data
             print(f"\n✅ Blockchain cargada desde '{filename}' ({len(self.chain)} bloques)")
             return True
             
@@ -252,6 +509,12 @@ class Blockchain:
         Returns:
             El bloque encontrado o None si no existe
         """
+        # add_block asigna los IDs de forma consecutiva desde 0, así que el ID
+        # coincide con la posición en la lista: acceso directo en O(1)
+        if 0 <= block_id < len(self.chain) and self.chain[block_id].block_id == block_id:
+            return self.chain[block_id]
+        
+        # Búsqueda lineal por si la cadena tiene IDs no consecutivos
         for block in self.chain:
             if block.block_id == block_id:
                 return block
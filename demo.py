@@ -3,11 +3,46 @@ Script de demostración automática de la mini-blockchain
 Ejecuta una serie de operaciones para mostrar todas las funcionalidades
 """
 
+import os
 import sys
 from blockchain import Blockchain
 import time
 
 
+def read_demo_speed() -> int:
+    """
+    Lee el factor de aceleración de la variable de entorno DEMO_SPEED.
+
+    Returns:
+        Entero mayor o igual a 1; si el valor no es válido se usa 1
+    """
+    value = os.getenv("DEMO_SPEED", "1")
+    try:
+        speed = int(value)
+    except ValueError:
+        speed = 0
+    if speed < 1:
+        print(f"⚠️  DEMO_SPEED inválido ('{value}'): se usará 1 (entero >= 1)")
+        return 1
+    return speed
+
+
+# Factor de aceleración de las pausas de la demo (DEMO_SPEED=1000 las elimina,
+# útil para ejecutarla como prueba rápida o benchmark)
+DEMO_SPEED = read_demo_speed()
+
+
+def pause(seconds: float):
+    """
+    Hace una pausa escalada según DEMO_SPEED.
+
+    Args:
+        seconds: Duración de la pausa a velocidad normal
+    """
+    if DEMO_SPEED < 1000:
+        time.sleep(seconds / DEMO_SPEED)
+
+
 def demo():
     """Ejecuta una demostración completa del sistema."""
 
@@ -15,7 +50,7 @@ def demo():
     print("\n[1] Creando nueva blockchain...")
     blockchain = Blockchain()
     print("✅ Blockchain inicializada con bloque génesis")
-    time.sleep(1)
+    pause(1)
 
     # 2. Agregar bloques
     print("\n" + "-" * 70)
@@ -33,15 +68,15 @@ def demo():
     for i, data in enumerate(transactions, 1):
         print(f"\n  Agregando bloque #{i}...")
         block = blockchain.add_block(data)
-        print(f"  ✅ Bloque creado - Hash: {block.hash[:16]}...")
-        time.sleep(0.5)
+        print(f"  ✅ Bloque creado - Hash: {block.hash.hex()[:16]}...")
+        pause(0.5)
 
     # 3. Mostrar la cadena
     print("\n" + "-" * 70)
     print("[3] Mostrando toda la cadena:")
     print("-" * 70)
     blockchain.display_chain()
-    time.sleep(2)
+    pause(2)
 
     # 4. Verificar integridad (primera vez)
     print("\n" + "-" * 70)
@@ -53,14 +88,14 @@ def demo():
         print(
             f"   Todos los {len(blockchain.chain)} bloques están correctamente encadenados."
         )
-    time.sleep(2)
+    pause(2)
 
     # 5. Guardar blockchain
     print("\n" + "-" * 70)
     print("[5] Guardando blockchain en archivo...")
     print("-" * 70)
     blockchain.save_to_file("demo_blockchain.json")
-    time.sleep(1)
+    pause(1)
 
     # 6. Simular ataque
     print("\n" + "-" * 70)
@@ -70,7 +105,7 @@ def demo():
     blockchain.corrupt_block(
         2, "DATOS CORRUPTOS - Transacción fraudulenta: Hacker -> Hacker $999999"
     )
-    time.sleep(1)
+    pause(1)
 
     # 7. Verificar integridad (después del ataque)
     print("\n" + "-" * 70)
@@ -83,7 +118,7 @@ def demo():
         print(f"\n   Se encontraron {len(errors)} error(es):\n")
         for error in errors:
             print(f"   {error}\n")
-    time.sleep(2)
+    pause(2)
 
     # 8. Mostrar bloque corrupto
     print("\n" + "-" * 70)
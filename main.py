@@ -185,7 +185,7 @@ def load_blockchain(blockchain: Blockchain) -> Blockchain:
     if not filename.endswith(".json"):
         filename += ".json"
 
-    new_blockchain = Blockchain()
+    new_blockchain = Blockchain(create_genesis=False)
     if new_blockchain.load_from_file(filename):
         return new_blockchain
     else:
@@ -196,11 +196,7 @@ def load_blockchain(blockchain: Blockchain) -> Blockchain:
 def main():
     """Función principal de la aplicación."""
 
-    blockchain = Blockchain()
-
-    temp_blockchain = Blockchain()
-    if temp_blockchain.load_from_file("blockchain.json"):
-        blockchain = temp_blockchain
+    blockchain = Blockchain.load_or_new("blockchain.json")
 
     # Bucle principal
     while True: